@@ -20,9 +20,19 @@ from mycroft.audio import wait_while_speaking
 from mycroft.messagebus import Message
 from mycroft.skills.common_play_skill import CommonPlaySkill, CPSMatchLevel
 
-from .stations.match import match_station_from_utterance, Match, MatchConfidence
-from .stations.station import Station, stations
-from .stations.util import find_mime_type
+from .stations.match import (
+    clear_match_cache,
+    EXACT_V,
+    GENERIC_V,
+    LIKELY_V,
+    match_station_from_utterance,
+)
+from .stations.station import (
+    Station,
+    STATION_INFO_BY_NAME,
+    STATIONS_BY_NAME,
+)
+from .stations.util import DEFAULT_MIME_TYPE, find_stream_mime_type
 
 
 class Status(enum.Enum):
@@ -101,9 +111,8 @@ class ABCRadioSkill(CommonPlaySkill):
 
     def CPS_start(self, _, data):
         """Handle request from Common Play System to start playback."""
-        for station in stations:
-            if station.name == data["name"]:
-                return self._play_station(station)
+        station = STATIONS_BY_NAME.get(data["name"])
+        return self._play_station(station) if station else None
 
     def CPS_match_query_phrase(self, phrase: str) -> Tuple[str, float, dict]:
         """Respond to Common Play Service query requests.
@@ -112,25 +121,22 @@ class ABCRadioSkill(CommonPlaySkill):
             phrase: utterance request to parse
 
         Returns:
-            Tuple(Name of station, confidence, Station information)
+            Tuple(Name of station, confidence, Station information) or None
+            if no station matched with at least GENERIC confidence
         """
-        match = match_station_from_utterance(self, phrase)
-
-        # If no match but utterance contains news, return low confidence level
-        if match.confidence < MatchConfidence.GENERIC.value:
-            match = Match(self.get_default_station(), MatchConfidence.GENERIC)
+        station, confidence = match_station_from_utterance(phrase)
 
         # Translate match confidence levels to CPSMatchLevels
-        if match.confidence >= MatchConfidence.EXACT.value:
+        if confidence >= EXACT_V:
             match_level = CPSMatchLevel.EXACT
-        elif match.confidence >= MatchConfidence.LIKELY.value:
+        elif confidence >= LIKELY_V:
             match_level = CPSMatchLevel.ARTIST
-        elif match.confidence >= MatchConfidence.GENERIC.value:
+        elif confidence >= GENERIC_V:
             match_level = CPSMatchLevel.CATEGORY
         else:
             return None
 
-        return match.station.name, match_level, match.station.as_dict
+        return station.name, match_level, STATION_INFO_BY_NAME[station.name]
 
     def _play_station(self, station: Station):
         """Play the given station using the most appropriate service.
@@ -139,10 +145,10 @@ class ABCRadioSkill(CommonPlaySkill):
             station (Station): Instance of a Station to be played
         """
         try:
-            self.log.info(f"Playing station: {station.name}")
+            self.log.info("Playing station: %s", station.name)
             media_url = station.mp3_stream
-            self.log.info(f"Station url: {media_url}")
-            mime = find_mime_type(media_url)
+            self.log.debug("Station url: %s", media_url)
+            mime = find_stream_mime_type(media_url) or DEFAULT_MIME_TYPE
             # Ensure announcement of station has finished before playing
             wait_while_speaking()
 
@@ -193,6 +199,10 @@ class ABCRadioSkill(CommonPlaySkill):
         self.CPS_release_output_focus()
         return True
 
+    def shutdown(self):
+        """Clear cached station matches when the Skill is unloaded."""
+        clear_match_cache()
+
 
 def create_skill():
     return ABCRadioSkill()
@@ -14,11 +14,59 @@
 
 import enum
 from collections import namedtuple
+from functools import lru_cache
 
 from mycroft.util import LOG
-from mycroft.util.parse import fuzzy_match
+from rapidfuzz import fuzz, process
 
 from .station import stations
+from .trie import TrieNode
+
+# Minimum number of characters an utterance must share with a station term
+# before that station is shortlisted for fuzzy matching.
+MIN_PREFIX_LENGTH = 3
+
+
+def build_station_trie(stations_to_index) -> TrieNode:
+    """Build a prefix trie of every lowercased station name and alias.
+
+    Each word boundary within a term is also indexed so that eg "radio
+    national" still finds "ABC Radio National".
+    """
+    root = TrieNode()
+    for station in stations_to_index:
+        for term in station.search_terms:
+            words = term.split()
+            for start in range(len(words)):
+                root.insert(" ".join(words[start:]), station)
+    return root
+
+
+def flatten_search_terms(stations_to_flatten):
+    """Flatten station search terms into parallel lists for batch scoring.
+
+    Returns:
+        tuple: list of every search term, list of the station for each term
+    """
+    terms = []
+    term_stations = []
+    for station in stations_to_flatten:
+        for term in station.search_terms:
+            terms.append(term)
+            term_stations.append(station)
+    return terms, term_stations
+
+
+_station_trie = build_station_trie(stations)
+_all_terms, _term_to_station = flatten_search_terms(stations)
+
+# Every search term padded to match whole words, with parallel stations,
+# longest first so that eg "triple j unearthed" is found before "triple j".
+_exact_order = sorted(
+    range(len(_all_terms)), key=lambda index: len(_all_terms[index]), reverse=True
+)
+_exact_terms = [f" {_all_terms[index]} " for index in _exact_order]
+_exact_term_stations = [_term_to_station[index] for index in _exact_order]
 
 
 class MatchConfidence(enum.Enum):
@@ -30,46 +78,97 @@ class MatchConfidence(enum.Enum):
     GENERIC = 0.6
 
 
+# Plain float thresholds for the matching hot path, avoiding enum lookups.
+EXACT_V = MatchConfidence.EXACT.value
+HIGH_V = MatchConfidence.HIGH.value
+LIKELY_V = MatchConfidence.LIKELY.value
+GENERIC_V = MatchConfidence.GENERIC.value
+
+
 Match = namedtuple("Match", "station confidence")
 
 
-def match_station_name(phrase, station):
-    """Determine confidence that a phrase requested a given station.
+def best_term_match(phrase, terms):
+    """Find the term most similar to a phrase.
 
     Args:
-        phrase (str): utterance from the user
-        station (str): the station feed to match against
+        phrase (str): normalized utterance from the user
+        terms (list): lowercased search terms to score
 
     Returns:
-        tuple: feed being matched, highest confidence level found
+        tuple: index of the best term, its confidence; (None, 0.0) if no terms
     """
-    phrase = phrase.lower().replace("play", "").strip()
+    best = process.extractOne(phrase, terms, scorer=fuzz.ratio, processor=None)
+    if best is None:
+        return None, 0.0
+    _, score, index = best
+    return index, score / 100.0
 
-    match_confidences = [
-        fuzzy_match(phrase, station.name.lower()),
-    ]
-    match_confidences.extend(
-        [fuzzy_match(phrase, alias.lower()) for alias in station.aliases]
-    )
 
-    highest_confidence = max(match_confidences)
-    return Match(station, highest_confidence)
+def shortlist_stations(utterance):
+    """Find stations sharing a prefix with any word onwards in the utterance.
 
+    Every station below the first MIN_PREFIX_LENGTH characters is kept, so
+    stations that share that prefix but branch off later are still scored.
 
-def match_station_from_utterance(skill, utterance):
-    """Get the expected station from a user utterance.
+    Args:
+        utterance (str): lowercased utterance from the user
 
     Returns:
-        Station or None if news not requested.
+        list: candidate stations, empty if none share a long enough prefix
     """
-    match = Match(None, 0.0)
+    candidates = []
+    words = utterance.split()
+    for start in range(len(words)):
+        prefix = " ".join(words[start:])[:MIN_PREFIX_LENGTH]
+        depth, node = _station_trie.longest_prefix(prefix)
+        if depth < MIN_PREFIX_LENGTH:
+            continue
+        for station in node.stations():
+            if station not in candidates:
+                candidates.append(station)
+    return candidates
+
+
+def match_station_from_utterance(utterance):
+    """Get the expected station from a user utterance.
 
-    utterance = utterance.lower().strip()
+    Results are cached per normalized phrase as the station list is static.
 
-    # Test against each station to find the best match.
-    for station in stations:
-        station_match = match_station_name(utterance, station)
-        if station_match.confidence > match.confidence:
-            match = station_match
+    Args:
+        utterance (str): utterance from the user
 
-    return match
+    Returns:
+        Match: best matching station and confidence, or (None, 0.0) if there
+        are no stations to match against
+    """
+    return _match_normalized_phrase(utterance.lower().replace("play", "").strip())
+
+
+@lru_cache(maxsize=512)
+def _match_normalized_phrase(utterance):
+    """Find the best matching station for an already normalized phrase."""
+    # Whole station names within the utterance need no fuzzy matching.
+    padded_utterance = f" {utterance} "
+    for index, term in enumerate(_exact_terms):
+        if term in padded_utterance:
+            return Match(_exact_term_stations[index], EXACT_V)
+
+    # Score every term of the shortlisted stations in a single call.
+    candidates = shortlist_stations(utterance)
+    if candidates:
+        terms, term_stations = flatten_search_terms(candidates)
+        index, confidence = best_term_match(utterance, terms)
+        if index is not None and confidence >= GENERIC_V:
+            return Match(term_stations[index], confidence)
+
+    # Nothing useful was shortlisted so score against every station.
+    index, confidence = best_term_match(utterance, _all_terms)
+    if index is None:
+        return Match(None, 0.0)
+    return Match(_term_to_station[index], confidence)
+
+
+def clear_match_cache():
+    """Drop all cached utterance matches, eg when the Skill is reloaded."""
+    _match_normalized_phrase.cache_clear()
@@ -14,13 +14,30 @@
 """Defines a News Station object"""
 
 from builtins import property
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Tuple
 
 from mycroft.util import LOG
 
+# Note that this traverses the path from this file and may break if this is
+# moved in the file hierarchy.
+SKILL_PATH = Path(__file__).parent.parent.absolute()
 
-@dataclass(frozen=True)
+
+@lru_cache(maxsize=None)
+def _resolve_image_path(image_file: str) -> Path:
+    """Find a station logo on disk, falling back to the generic image."""
+    file_path = Path(SKILL_PATH, "ui", "station-logos", image_file)
+    if not file_path.exists():
+        LOG.warning(f"{image_file} could not be found, using default image")
+        file_path = Path(SKILL_PATH, "images", "generic.png")
+    return file_path
+
+
+# slots=True requires Python 3.10 or later, see README.md
+@dataclass(frozen=True, slots=True)
 class Station:
     """ABC News Station."""
 
@@ -34,42 +51,62 @@ class Station:
     # Streams defined at: https://help.abc.net.au/hc/en-us/articles/4402927208079-Where-can-I-find-direct-stream-URLs-for-ABC-Radio-stations-
     stream: str
     base_url: str = "http://www.abc.net.au/res/streaming/audio/"
+    # Derived values that never change, computed once in __post_init__
+    _mp3_stream: str = field(init=False, repr=False, compare=False)
+    _aac_stream: str = field(init=False, repr=False, compare=False)
+    _as_dict: dict = field(init=False, repr=False, compare=False)
+    _search_terms: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclasses must bypass __setattr__ to set derived fields
+        object.__setattr__(self, "_mp3_stream", f"{self.base_url}/mp3/{self.stream}")
+        object.__setattr__(self, "_aac_stream", f"{self.base_url}/aac/{self.stream}")
+        object.__setattr__(
+            self,
+            "_search_terms",
+            (self.name.lower(), *[alias.lower() for alias in self.aliases]),
+        )
+        object.__setattr__(
+            self,
+            "_as_dict",
+            {
+                "name": self.name,
+                "image_path": str(self.image_path),
+            },
+        )
 
     @property
     def as_dict(self):
-        return {
-            "name": self.name,
-            "image_path": str(self.image_path),
-        }
+        return self._as_dict
 
     @property
     def image_path(self) -> Path:
         """The absolute path to the stations logo.
 
-        Note that this currently traverses the path from this file and may
-        break if this is moved in the file hierarchy.
+        Each logo is checked on disk once, when the station is constructed at
+        import to build its as_dict. Later accesses reuse that result.
         """
         if self.image_file is None:
             return None
-        skill_path = Path(__file__).parent.parent.absolute()
-        file_path = Path(skill_path, "ui", "station-logos", self.image_file)
-        if not file_path.exists():
-            LOG.warning(f"{self.image_file} could not be found, using default image")
-            file_path = Path(skill_path, "images", "generic.png")
-        return file_path
+        return _resolve_image_path(self.image_file)
+
+    @property
+    def search_terms(self) -> Tuple[str, ...]:
+        """Lowercased name and aliases to match utterances against."""
+        return self._search_terms
 
     @property
     def mp3_stream(self) -> str:
         """The MP3 stream url."""
-        return f"{self.base_url}/mp3/{self.stream}"
+        return self._mp3_stream
 
     @property
     def aac_stream(self) -> str:
         """The AAC+ stream url."""
-        return f"{self.base_url}/aac/{self.stream}"
+        return self._aac_stream
 
 
-stations = [
+stations = (
     Station(
         name="ABC News",
         aliases=[],
@@ -119,4 +156,12 @@ stations = [
     #     color="#",
     #     stream=""
     # ),
-]
+)
+
+# Stations keyed by their name as sent back to CPS_start.
+STATIONS_BY_NAME: Dict[str, Station] = {station.name: station for station in stations}
+
+# Common Play payload for each station, keyed by station name.
+STATION_INFO_BY_NAME: Dict[str, dict] = {
+    station.name: station.as_dict for station in stations
+}
@@ -0,0 +1,69 @@
+# Copyright 2022 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Defines a character prefix trie used to shortlist matching Stations"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .station import Station
+
+
+@dataclass
+class TrieNode:
+    """Single character node of a prefix trie of station search terms."""
+
+    children: Dict[str, "TrieNode"] = field(default_factory=dict)
+    station_ref: Optional[Station] = None
+
+    def insert(self, term: str, station: Station):
+        """Add a term to the trie, storing the station at its terminal node.
+
+        Args:
+            term: lowercased station name or alias
+            station: the station the term refers to
+        """
+        node = self
+        for char in term:
+            node = node.children.setdefault(char, TrieNode())
+        node.station_ref = station
+
+    def stations(self) -> List[Station]:
+        """All stations stored at or below this node."""
+        found = []
+        pending = [self]
+        while pending:
+            node = pending.pop()
+            if node.station_ref is not None and node.station_ref not in found:
+                found.append(node.station_ref)
+            pending.extend(node.children.values())
+        return found
+
+    def longest_prefix(self, text: str) -> Tuple[int, "TrieNode"]:
+        """Walk the trie along text for as long as characters match.
+
+        Args:
+            text: string to walk from the root of this node
+
+        Returns:
+            tuple: length of the matched prefix, node it ended on
+        """
+        node = self
+        depth = 0
+        for char in text:
+            child = node.children.get(char)
+            if child is None:
+                break
+            node = child
+            depth += 1
+        return depth, node
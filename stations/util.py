@@ -14,25 +14,51 @@
 
 import requests
 from shutil import copyfile, SpecialFileError
+from typing import Dict, Optional
 
 from mycroft.util import LOG
 
+# Mime type to assume when a stream's type could not be determined.
+DEFAULT_MIME_TYPE = "audio/mpeg"
 
-def find_mime_type(url: str) -> str:
+# Mime types successfully reported for each stream url.
+_stream_mime_types: Dict[str, str] = {}
+
+
+def find_mime_type(url: str) -> Optional[str]:
     """Determine the mime type of a file at the given url.
 
     Args:
         url: remote url to check
     Returns:
-        Mime type - defaults to 'audio/mpeg'
+        Mime type - None if the server did not report one
     """
-    mime = "audio/mpeg"
+    mime = None
     response = requests.Session().head(url, allow_redirects=True)
     if 200 <= response.status_code < 300:
         mime = response.headers["content-type"]
     return mime
 
 
+def find_stream_mime_type(url: str) -> Optional[str]:
+    """Determine the mime type of a stream, remembering successful lookups.
+
+    The first lookup of each stream sends a HEAD request to the url. Failed
+    lookups return None and are retried on the next call.
+
+    Args:
+        url: remote stream url to check
+    Returns:
+        Mime type - None if the server did not report one
+    """
+    mime = _stream_mime_types.get(url)
+    if mime is None:
+        mime = find_mime_type(url)
+        if mime is not None:
+            _stream_mime_types[url] = mime
+    return mime
+
+
 def contains_html(file: str) -> bool:
     """Reads file and reports if a <html> tag is contained.
 
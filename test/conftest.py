@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the skill's stations package importable without installing the skill.
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,77 @@
+# Copyright 2022 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from stations.match import (
+    GENERIC_V,
+    MIN_PREFIX_LENGTH,
+    build_station_trie,
+    match_station_from_utterance,
+    shortlist_stations,
+)
+from stations.station import STATIONS_BY_NAME, Station
+
+
+def test_trie_indexes_each_word_suffix_of_a_term():
+    station = Station(
+        name="ABC Radio National",
+        aliases=[],
+        image_file=None,
+        color="#000000",
+        stream="radio_national.pls",
+    )
+    trie = build_station_trie([station])
+    for suffix in ["abc radio national", "radio national", "national"]:
+        depth, node = trie.longest_prefix(suffix)
+        assert depth == len(suffix)
+        assert node.station_ref == station
+
+
+def test_shortlist_requires_minimum_prefix_length():
+    assert shortlist_stations("abc"[: MIN_PREFIX_LENGTH - 1]) == []
+    assert STATIONS_BY_NAME["ABC News"] in shortlist_stations("abc")
+
+
+def test_shortlist_keeps_stations_branching_after_the_prefix():
+    candidates = shortlist_stations("abc nat sprt")
+    assert STATIONS_BY_NAME["ABC Sport"] in candidates
+    assert STATIONS_BY_NAME["ABC News"] in candidates
+
+
+def test_shortlist_is_empty_for_unrelated_words():
+    assert shortlist_stations("something else") == []
+
+
+def test_empty_shortlist_still_scores_every_station():
+    station, confidence = match_station_from_utterance("play tripple jay")
+    assert station == STATIONS_BY_NAME["triple j"]
+    assert confidence >= GENERIC_V
+
+
+def test_weak_shortlist_falls_back_to_every_station():
+    # "nat" shortlists only ABC Radio National, but ABC News scores higher.
+    station, confidence = match_station_from_utterance("play nat nws")
+    assert station == STATIONS_BY_NAME["ABC News"]
+    assert confidence >= GENERIC_V
+
+
+def test_best_station_is_found_beyond_the_deepest_prefix():
+    # Only shortlisting below the deepest node reached, eg "abc n" or
+    # "abc rad", drops the best station while a weaker one passes GENERIC.
+    for utterance, expected in [
+        ("play abc nat sprt", "ABC Sport"),
+        ("play abc radyo nws", "ABC News"),
+    ]:
+        station, confidence = match_station_from_utterance(utterance)
+        assert station == STATIONS_BY_NAME[expected]
+        assert confidence >= GENERIC_V
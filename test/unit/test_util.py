@@ -0,0 +1,35 @@
+# Copyright 2022 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from stations import util
+from stations.util import find_stream_mime_type
+
+
+def test_failed_mime_lookup_is_retried(monkeypatch):
+    responses = [None, "audio/x-scpls", "unused"]
+    requested = []
+
+    def fake_find_mime_type(url):
+        requested.append(url)
+        return responses.pop(0)
+
+    monkeypatch.setattr(util, "find_mime_type", fake_find_mime_type)
+    monkeypatch.setattr(util, "_stream_mime_types", {})
+    url = "http://example.com/mp3/news_radio.pls"
+
+    assert find_stream_mime_type(url) is None
+    assert find_stream_mime_type(url) == "audio/x-scpls"
+    # A successful lookup is remembered
+    assert find_stream_mime_type(url) == "audio/x-scpls"
+    assert requested == [url, url]